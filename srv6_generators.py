@@ -25,11 +25,17 @@
 
 from __future__ import print_function
 
+from functools import lru_cache
+from socket import inet_ntoa
+from socket import inet_ntop
+from socket import AF_INET6
+
 from ipaddress import IPv6Network
 from ipaddress import IPv4Network
 from ipaddress import IPv6Interface
 from ipaddress import IPv4Interface
 from ipaddress import IPv4Address
+from ipaddress import AddressValueError
 
 from srv6_properties import RouterProperties
 from srv6_properties import HostProperties
@@ -48,35 +54,172 @@ bit = 16
 net = u"fcff::/%d" % bit
 
 
+# Integer value of the parsed prefixes, shared by the allocators
+_NET_INT = dict()
+
+
+# Parse a textual prefix (e.g. u"fcff::/16") and return the
+# integer value of its address, each prefix is parsed only once
+def _net_int(net, interface=IPv6Interface):
+    net_int = _NET_INT.get(net)
+    if net_int is None:
+        net_int = _NET_INT[net] = int(interface(net).ip)
+    return net_int
+
+
+# Mask clearing the host bits of a prefix (e.g. /64 on 128 bits):
+# the bits above the address are kept, so that out of range values
+# are still rejected instead of wrapping around
+def _net_mask(prefix, bits=128):
+    return ~((1 << (bits - prefix)) - 1)
+
+
+# Error raised for an integer out of the address range, with
+# the same type and message of ipaddress
+def _address_value_error(ip_int, version, bits):
+    if ip_int < 0:
+        return AddressValueError("%d (< 0) is not permitted as an IPv%d address"
+                                 % (ip_int, version))
+    return AddressValueError("%d (>= 2**%d) is not permitted as an IPv%d address"
+                             % (ip_int, bits, version))
+
+
+# Longest run of set bits in a byte, as (start, length), the lowest
+# run wins in case of ties. Bit i tells if the IPv6 group i is zero
+def _longest_run(mask):
+    best_start, best_len = 0, 0
+    start = -1
+    for i in range(8):
+        if mask >> i & 1:
+            if start == -1:
+                start = i
+            if i - start + 1 > best_len:
+                best_start, best_len = start, i - start + 1
+        else:
+            start = -1
+    return best_start, best_len
+
+
+_LONGEST_RUN = [_longest_run(mask) for mask in range(256)]
+
+
+# Format an integer as a compressed IPv6 address string (RFC 5952),
+# this avoids building IPv6Network/IPv6Interface objects just to print them
+def _ipv6_int_to_str_py(ip_int):
+    if ip_int < 0 or ip_int >> 128:
+        raise _address_value_error(ip_int, 6, 128)
+    # Split the address in eight 16-bit groups
+    groups = [(ip_int >> (16 * i)) & 0xFFFF for i in range(7, -1, -1)]
+    # Flag the zero groups in a byte and look up their longest run
+    g0, g1, g2, g3, g4, g5, g6, g7 = groups
+    mask = ((not g0) | (not g1) << 1 | (not g2) << 2 | (not g3) << 3 |
+            (not g4) << 4 | (not g5) << 5 | (not g6) << 6 | (not g7) << 7)
+    best_start, best_len = _LONGEST_RUN[mask]
+    hextets = ["%x" % group for group in groups]
+    # A single zero group is not compressed
+    if best_len > 1:
+        return "%s::%s" % (":".join(hextets[:best_start]),
+                           ":".join(hextets[best_start + best_len:]))
+    return ":".join(hextets)
+
+
+# Format an integer as a compressed IPv6 address string
+# using the C implementation of inet_ntop. It gives the same output
+# of ipaddress, except for the addresses starting with a zero group
+# which can be printed with an embedded IPv4 address (e.g. ::ffff:1.2.3.4),
+# those are left to the Python formatter
+def _ipv6_int_to_str_ntop(ip_int):
+    if ip_int >> 112:
+        try:
+            return inet_ntop(AF_INET6, ip_int.to_bytes(16, "big"))
+        except OverflowError:
+            # Out of range, a negative integer or one beyond 128 bits
+            raise _address_value_error(ip_int, 6, 128)
+    return _ipv6_int_to_str_py(ip_int)
+
+
+_ipv6_int_to_str = _ipv6_int_to_str_ntop
+
+
+# Format an integer as a dotted-decimal IPv4 address string
+def _ipv4_int_to_str(ip_int):
+    try:
+        return inet_ntoa(ip_int.to_bytes(4, "big"))
+    except OverflowError:
+        # Out of range, a negative integer or one beyond 32 bits
+        raise _address_value_error(ip_int, 4, 32)
+
+
+# Max number of results remembered by each memoized allocator function,
+# the caches are shared by all the allocator classes (least recently
+# used results are evicted first), so they are sized for all the links
+# of a large topology
+MEMOIZE_SIZE = 1 << 16
+
+
 class SIDAllocator(object):
 
     # Address space for SIDs: fcff:xxxx:2:0/64
     # (e.g. fcff:xxxx:0002:0000:0000:0002:0000:tttt)
     # where 'xxxx' is the router id and tttt the vpn id
 
+    __slots__ = ()
     prefix = 64
-
-    def getSID(self, router_id, vpn_id):
-        # Generate the SID
-        prefix = int(IPv6Interface(net).ip)
-        router_id = int(IPv4Address(router_id))
-        sid = IPv6Network(prefix | router_id << 96 | 2 << 80 | vpn_id)
-        # Remove /128 mask and convert to string
-        sid = IPv6Interface(sid).ip.__str__()
-        # Return the SID
-        return sid
-
-    def getSIDFamily(self, router_id):
-        # Generate the SID
-        prefix = int(IPv6Interface(net).ip)
-        router_id = int(IPv4Address(router_id))
-        sidFamily = IPv6Network(prefix | router_id << 96 | 2 << 80)
-        # Append prefix /64
-        sidFamily = sidFamily.supernet(new_prefix=SIDAllocator.prefix)
-        # Convert to string
-        sidFamily = IPv6Interface(sidFamily).__str__()
-        # Return the SID
-        return sidFamily
+    _PREFIX_INT = _net_int(net)
+    # The constant tag (2) is folded in the base
+    _BASE_INT = _PREFIX_INT | 2 << 80
+    # Fixed shape of the SIDs of the router ids below 0.1.0.0:
+    # net:xxxx:tag::tttt, the zeros between the tag and the vpn
+    # id are always the longest run and get compressed
+    _SID_FMT = "%x:%%x:%x::%%x" % (_BASE_INT >> 112, _BASE_INT >> 80 & 0xFFFF)
+    _SID_FAMILY_FMT = "%x:%%x:%x::/%d" % (_BASE_INT >> 112,
+                                          _BASE_INT >> 80 & 0xFFFF, prefix)
+
+    @staticmethod
+    def getSID(router_id, vpn_id):
+        # Generate the SID and convert to string
+        return _sid(_router_id_int(router_id), vpn_id)
+
+    @staticmethod
+    def getSIDByIndex(router_index, vpn_id):
+        # Same as getSID, for a router id generated by RouterIdAllocator
+        # from router_index: the dotted router id does not need to be parsed
+        return _sid(router_index, vpn_id)
+
+    @staticmethod
+    def getSIDFamily(router_id):
+        # Generate the SID family and convert to string
+        return _sid_family(_router_id_int(router_id))
+
+
+# Integer value of a router id: it is parsed only once per router,
+# later VPNs of the same router reuse it
+@lru_cache(maxsize=MEMOIZE_SIZE)
+def _router_id_int(router_id):
+    return int(IPv4Address(router_id))
+
+
+# SID of a router for a vpn, as string: the results only depend on
+# the integer router id and on the vpn id, so they are memoized
+@lru_cache(maxsize=MEMOIZE_SIZE)
+def _sid(router_index, vpn_id):
+    if 0 <= router_index < 0x10000 and 0 < vpn_id < 0x10000:
+        # Format directly the fixed shape
+        return SIDAllocator._SID_FMT % (router_index, vpn_id)
+    # Generate the SID and convert to string
+    return _ipv6_int_to_str(SIDAllocator._BASE_INT | router_index << 96 | vpn_id)
+
+
+# SID family of a router, as string
+@lru_cache(maxsize=MEMOIZE_SIZE)
+def _sid_family(router_index):
+    if 0 <= router_index < 0x10000:
+        # Format directly the fixed shape
+        return SIDAllocator._SID_FAMILY_FMT % router_index
+    # The family is already aligned to /64, append the prefix
+    # and convert to string
+    return "%s/%d" % (_ipv6_int_to_str(SIDAllocator._BASE_INT | router_index << 96),
+                      SIDAllocator.prefix)
 
 
 # Allocates loopbacks
@@ -85,16 +228,18 @@ class LoopbackAllocator(object):
   # Loopback address space for the router xxxx
   # fcff:xxxx:0:0::/64
 
+  __slots__ = ()
   prefix = 64
-
-  def getLoopbackAddress(self, router_index):
-    # Generate the loopback address
-    prefix = int(IPv6Interface(net).ip)
-    loopbackip = IPv6Network(prefix | router_index << 96 | 1)
-    # Remove /128 mask and convert to string
-    loopbackip = IPv6Interface(loopbackip).ip.__str__()
+  _PREFIX_INT = _net_int(net)
+  # Fixed shape of the base of the router indexes below 0x10000
+  _BASE_FMT = "%x:%%x::" % (_PREFIX_INT >> 112)
+
+  @staticmethod
+  def getLoopbackAddress(router_index):
+    # Generate the loopback address and convert to string
+    loopbackip = "%s1" % _router_base(LoopbackAllocator, router_index)
     # Return the address
-    return loopbackip.__str__()
+    return loopbackip
 
 
 # Allocates router networks
@@ -103,16 +248,18 @@ class RouterNetAllocator(object):
   # Each router exports a /32
   # fcff:xxxx::/32
 
+  __slots__ = ()
   prefix = 32
-
-  def getRouterNet(self, router_index):
-      # Generate the router net
-      prefix = int(IPv6Interface(net).ip)
-      routernet = IPv6Network(prefix | router_index << 96)
-      # Append prefix /32
-      routernet = routernet.supernet(new_prefix=RouterNetAllocator.prefix)
-      # Convert to string
-      routernet = IPv6Interface(routernet).__str__()
+  _PREFIX_INT = _net_int(net)
+  # Fixed shape of the base of the router indexes below 0x10000
+  _BASE_FMT = "%x:%%x::" % (_PREFIX_INT >> 112)
+
+  @staticmethod
+  def getRouterNet(router_index):
+      # Generate the router net, it is already aligned to /32:
+      # append the prefix and convert to string
+      routernet = "%s/%d" % (_router_base(RouterNetAllocator, router_index),
+                             RouterNetAllocator.prefix)
       # Return the net
       return routernet
 
@@ -122,14 +269,115 @@ class RouterIdAllocator(object):
 
   # Router IDs start from 0.0.0.1
 
-  def getRouterId(self, router_index):
-    # Generate the router id
-    router_id = IPv4Address(router_index)
+  __slots__ = ()
+
+  @staticmethod
+  def getRouterId(router_index):
+    # Generate the router id and convert to string
+    router_id = _ipv4_int_to_str(router_index)
     # Return the address
-    return router_id.__str__()
+    return router_id
+
+
+# Format the fcff:xxxx:: base of a router with the prefix of the
+# allocator cls: the indexes which fit in the xxxx group have a fixed
+# shape and do not need the generic formatter
+def _router_base(cls, router_index):
+    if 0 < router_index < 0x10000:
+        return cls._BASE_FMT % router_index
+    return _ipv6_int_to_str(cls._PREFIX_INT | router_index << 96)
+
+
+# Generate loopback address, router id and router net of a router
+# with a single bit operation: loopback and router net share the
+# same fcff:xxxx:: base, which formats with trailing '::' (the lower
+# 64 bits are zero), so the loopback is the base followed by 1
+def _router_triple(router_index):
+    base = _router_base(LoopbackAllocator, router_index)
+    loopback = "%s1" % base
+    routerid = _ipv4_int_to_str(router_index)
+    routernet = "%s/%d" % (base, RouterNetAllocator.prefix)
+    return loopback, routerid, routernet
+
+
+# Allocator packing two indexes in the bits of a base prefix:
+# net = base | a << lshift | b << rshift
+# The two sides of the net get the host ids lhost and rhost.
+# The address family specific parts are provided by
+# BitPackedIPv6Allocator and BitPackedIPv4Allocator, each allocator
+# exposes getNet and the addresses of the two sides with the names
+# of its own indexes
+class BitPackedAllocator(object):
+
+    __slots__ = ()
+    lshift = 0
+    rshift = 0
+    lhost = 1
+    rhost = 2
+
+    def getLinkTriple(self, a, b):
+        # Generate net and addresses of both sides from the same base:
+        # the net is returned as string, like str(getNet(a, b))
+        return _packed_link_triple(self.__class__, a, b)
+
+    @classmethod
+    def _addresses(cls, net):
+        return (cls._int_to_str(net | cls.lhost),
+                cls._int_to_str(net | cls.rhost))
 
 
-class IPv6NetAllocator(object):
+class BitPackedIPv6Allocator(BitPackedAllocator):
+
+    __slots__ = ()
+    _network = IPv6Network
+    _int_to_str = staticmethod(_ipv6_int_to_str)
+
+    @classmethod
+    def _addresses(cls, net):
+        # If the lower 64 bits are zero (and the first group is not)
+        # the trailing zeros are the longest run, so the net formats
+        # as 'xxxx:...::' and the two sides only append their host id
+        if net >> 112 and not net & 0xFFFFFFFFFFFFFFFF:
+            net_str = _ipv6_int_to_str(net)
+            return ("%s%x" % (net_str, cls.lhost), "%s%x" % (net_str, cls.rhost))
+        return super(BitPackedIPv6Allocator, cls)._addresses(net)
+
+
+class BitPackedIPv4Allocator(BitPackedAllocator):
+
+    __slots__ = ()
+    _network = IPv4Network
+    _int_to_str = staticmethod(_ipv4_int_to_str)
+
+
+# Net, addresses and link triple of a BitPackedAllocator class:
+# the results only depend on the allocator class and on the indexes,
+# so they are memoized for when the same topology is generated again
+
+@lru_cache(maxsize=MEMOIZE_SIZE)
+def _packed_net(cls, a, b):
+    # Generate the net and clear the host bits
+    net = (cls._BASE_INT | a << cls.lshift | b << cls.rshift) & cls._NET_MASK
+    # Build the net with its prefix
+    return cls._network((net, cls.prefix))
+
+
+@lru_cache(maxsize=MEMOIZE_SIZE)
+def _packed_address(cls, a, b, host):
+    # Generate the address of the side with the given host id
+    # and convert to string
+    return cls._int_to_str(cls._BASE_INT | a << cls.lshift | b << cls.rshift | host)
+
+
+@lru_cache(maxsize=MEMOIZE_SIZE)
+def _packed_link_triple(cls, a, b):
+    base = cls._BASE_INT | a << cls.lshift | b << cls.rshift
+    lhs, rhs = cls._addresses(base)
+    net = "%s/%d" % (cls._int_to_str(base & cls._NET_MASK), cls.prefix)
+    return net, lhs, rhs
+
+
+class IPv6NetAllocator(BitPackedIPv6Allocator):
 
     # fcf0::/16 address space for the links in the operators network
 
@@ -140,39 +388,30 @@ class IPv6NetAllocator(object):
     # fcf0:0000:xxxx:yyyy::1/64 address of router xxxx
     # fcf0:0000:xxxx:yyyy::2/64 address of router yyyy
 
+    __slots__ = ()
     bit = 16
     net = u"fcf0::/%s" % bit
     prefix = 64
+    _PREFIX_INT = _net_int(net)
+    _BASE_INT = _PREFIX_INT
+    _NET_MASK = _net_mask(prefix)
+    lshift = 80
+    rshift = 64
 
     def getNet(self, l_router_index, r_router_index):
         # Generate the operator net
-        prefix = int(IPv6Interface(IPv6NetAllocator.net).ip)
-        operatorNet = IPv6Network(prefix | l_router_index << 80 | r_router_index << 64)
-        # Append prefix to the net
-        operatorNet = operatorNet.supernet(new_prefix=IPv6NetAllocator.prefix)
-        # Return the net
-        return operatorNet
+        return _packed_net(self.__class__, l_router_index, r_router_index)
 
     def getLRouterAddress(self, l_router_index, r_router_index):
-        # Generate the left router address
-        prefix = int(IPv6Interface(IPv6NetAllocator.net).ip)
-        lRouterAddress = IPv6Network(prefix | l_router_index << 80 | r_router_index << 64 | 1)
-        # Remove /128 mask from the address and convert to string
-        lRouterAddress = IPv6Interface(lRouterAddress).ip.__str__()
-        # Return the address
-        return lRouterAddress
+        # Generate the left router address and convert to string
+        return _packed_address(self.__class__, l_router_index, r_router_index, self.lhost)
 
     def getRRouterAddress(self, l_router_index, r_router_index):
-        # Generate the right router address
-        prefix = int(IPv6Interface(IPv6NetAllocator.net).ip)
-        rRouterAddress = IPv6Network(prefix | l_router_index << 80 | r_router_index << 64 | 2)
-        # Remove /128 mask from the address and convert to string
-        rRouterAddress = IPv6Interface(rRouterAddress).ip.__str__()
-        # Return the address
-        return rRouterAddress
+        # Generate the right router address and convert to string
+        return _packed_address(self.__class__, l_router_index, r_router_index, self.rhost)
 
 
-class IPv4NetAllocator(object):
+class IPv4NetAllocator(BitPackedIPv4Allocator):
 
     # fcf0::/16 address space for the links in the operators network
 
@@ -183,39 +422,30 @@ class IPv4NetAllocator(object):
     # fcf0:0000:xxxx:yyyy::1/64 address of router xxxx
     # fcf0:0000:xxxx:yyyy::2/64 address of router yyyy
 
+    __slots__ = ()
     bit = 8
     net = u"11.0.0.0/%s" % bit
     prefix = 30
+    _PREFIX_INT = _net_int(net, IPv4Interface)
+    _BASE_INT = _PREFIX_INT
+    _NET_MASK = _net_mask(prefix, 32)
+    lshift = 13
+    rshift = 2
 
     def getNet(self, l_router_index, r_router_index):
         # Generate the operator net
-        prefix = int(IPv4Interface(IPv4NetAllocator.net).ip)
-        operatorNet = IPv4Network(prefix | l_router_index << 13 | r_router_index << 2)
-        # Append prefix to the net
-        operatorNet = operatorNet.supernet(new_prefix=IPv4NetAllocator.prefix)
-        # Return the net
-        return operatorNet
+        return _packed_net(self.__class__, l_router_index, r_router_index)
 
     def getLRouterAddress(self, l_router_index, r_router_index):
-        # Generate the left router address
-        prefix = int(IPv4Interface(IPv4NetAllocator.net).ip)
-        lRouterAddress = IPv4Network(prefix | l_router_index << 13 | r_router_index << 2 | 1)
-        # Remove /128 mask from the address and convert to string
-        lRouterAddress = IPv4Interface(lRouterAddress).ip.__str__()
-        # Return the address
-        return lRouterAddress
+        # Generate the left router address and convert to string
+        return _packed_address(self.__class__, l_router_index, r_router_index, self.lhost)
 
     def getRRouterAddress(self, l_router_index, r_router_index):
-        # Generate the right router address
-        prefix = int(IPv4Interface(IPv4NetAllocator.net).ip)
-        rRouterAddress = IPv4Network(prefix | l_router_index << 13 | r_router_index << 2 | 2)
-        # Remove /128 mask from the address and convert to string
-        rRouterAddress = IPv4Interface(rRouterAddress).ip.__str__()
-        # Return the address
-        return rRouterAddress
+        # Generate the right router address and convert to string
+        return _packed_address(self.__class__, l_router_index, r_router_index, self.rhost)
 
 
-class IPv6CustomerFacingNetAllocator(object):
+class IPv6CustomerFacingNetAllocator(BitPackedIPv6Allocator):
 
     # fcff:xxxx:3::/48 customer facing subnets
 
@@ -226,39 +456,31 @@ class IPv6CustomerFacingNetAllocator(object):
     # fcff:xxxx:3:yy00::1/64 address of router xxxx
     # fcff:xxxx:3:yy00::2/64 address of host yy
 
+    __slots__ = ()
     bit = 48
     net = u"fcff::/%s" % bit
     prefix = 64
+    _PREFIX_INT = _net_int(net)
+    # The constant tag (3) is folded in the base
+    _BASE_INT = _PREFIX_INT | 3 << 80
+    _NET_MASK = _net_mask(prefix)
+    lshift = 96
+    rshift = 64
 
     def getNet(self, router_index, host_index):
         # Generate the operator net
-        prefix = int(IPv6Interface(IPv6CustomerFacingNetAllocator.net).ip)
-        operatorNet = IPv6Network(prefix | router_index << 96 | 3 << 80 | host_index << 64)
-        # Append prefix to the net
-        operatorNet = operatorNet.supernet(new_prefix=IPv6CustomerFacingNetAllocator.prefix)
-        # Return the net
-        return operatorNet
+        return _packed_net(self.__class__, router_index, host_index)
 
     def getRouterAddress(self, router_index, host_index):
-        # Generate the router address
-        prefix = int(IPv6Interface(IPv6CustomerFacingNetAllocator.net).ip)
-        routerAddress = IPv6Network(prefix | router_index << 96 | 3 << 80 | host_index << 64 | 1)
-        # Remove /128 mask from the address and convert to string
-        routerAddress = IPv6Interface(routerAddress).ip.__str__()
-        # Return the address
-        return routerAddress
+        # Generate the router address and convert to string
+        return _packed_address(self.__class__, router_index, host_index, self.lhost)
 
     def getHostAddress(self, router_index, host_index):
-        # Generate the host address
-        prefix = int(IPv6Interface(IPv6CustomerFacingNetAllocator.net).ip)
-        hostAddress = IPv6Network(prefix | router_index << 96 | 3 << 80 | host_index << 64 | 2)
-        # Remove /128 mask from the address and convert to string
-        hostAddress = IPv6Interface(hostAddress).ip.__str__()
-        # Return the address
-        return hostAddress
+        # Generate the host address and convert to string
+        return _packed_address(self.__class__, router_index, host_index, self.rhost)
 
 
-class IPv4CustomerFacingNetAllocator(object):
+class IPv4CustomerFacingNetAllocator(BitPackedIPv4Allocator):
 
     # fcff:xxxx:3::/48 customer facing subnets
 
@@ -269,39 +491,30 @@ class IPv4CustomerFacingNetAllocator(object):
     # fcff:xxxx:3:yy00::1/64 address of router xxxx
     # fcff:xxxx:3:yy00::2/64 address of host yy
 
+    __slots__ = ()
     bit = 16
     net = u"192.168.0.0/%s" % bit
     prefix = 24
+    _PREFIX_INT = _net_int(net, IPv4Interface)
+    _BASE_INT = _PREFIX_INT
+    _NET_MASK = _net_mask(prefix, 32)
+    lshift = 9
+    rshift = 2
 
     def getNet(self, router_index, host_index):
         # Generate the operator net
-        prefix = int(IPv4Interface(IPv4CustomerFacingNetAllocator.net).ip)
-        operatorNet = IPv4Network(prefix | router_index << 9 | host_index << 2)
-        # Append prefix to the net
-        operatorNet = operatorNet.supernet(new_prefix=IPv4CustomerFacingNetAllocator.prefix)
-        # Return the net
-        return operatorNet
+        return _packed_net(self.__class__, router_index, host_index)
 
     def getRouterAddress(self, router_index, host_index):
-        # Generate the router address
-        prefix = int(IPv4Interface(IPv4CustomerFacingNetAllocator.net).ip)
-        routerAddress = IPv4Network(prefix | router_index << 9 | host_index << 2 | 1)
-        # Remove /128 mask from the address and convert to string
-        routerAddress = IPv4Interface(routerAddress).ip.__str__()
-        # Return the address
-        return routerAddress
+        # Generate the router address and convert to string
+        return _packed_address(self.__class__, router_index, host_index, self.lhost)
 
     def getHostAddress(self, router_index, host_index):
-        # Generate the host address
-        prefix = int(IPv4Interface(IPv4CustomerFacingNetAllocator.net).ip)
-        hostAddress = IPv4Network(prefix | router_index << 9 | host_index << 2 | 2)
-        # Remove /128 mask from the address and convert to string
-        hostAddress = IPv4Interface(hostAddress).ip.__str__()
-        # Return the address
-        return hostAddress
+        # Generate the host address and convert to string
+        return _packed_address(self.__class__, router_index, host_index, self.rhost)
 
 
-class IPv6AccessNetAllocator(object):
+class IPv6AccessNetAllocator(BitPackedIPv6Allocator):
 
     # fcff:xxxx:3::/48 customer facing subnets
 
@@ -312,39 +525,31 @@ class IPv6AccessNetAllocator(object):
     # fcff:xxxx:3:yy00::1/64 address of router xxxx
     # fcff:xxxx:3:yy00::2/64 address of host yy
 
+    __slots__ = ()
     bit = 48
     net = u"fcfb::/%s" % bit
     prefix = 64
+    _PREFIX_INT = _net_int(net)
+    # The constant tag (3) is folded in the base
+    _BASE_INT = _PREFIX_INT | 3 << 80
+    _NET_MASK = _net_mask(prefix)
+    lshift = 96
+    rshift = 64
 
     def getNet(self, router_index, host_index):
         # Generate the operator net
-        prefix = int(IPv6Interface(IPv6AccessNetAllocator.net).ip)
-        operatorNet = IPv6Network(prefix | router_index << 96 | 3 << 80 | host_index << 64)
-        # Append prefix to the net
-        operatorNet = operatorNet.supernet(new_prefix=IPv6AccessNetAllocator.prefix)
-        # Return the net
-        return operatorNet
+        return _packed_net(self.__class__, router_index, host_index)
 
     def getRouterAddress(self, router_index, host_index):
-        # Generate the router address
-        prefix = int(IPv6Interface(IPv6AccessNetAllocator.net).ip)
-        routerAddress = IPv6Network(prefix | router_index << 96 | 3 << 80 | host_index << 64 | 1)
-        # Remove /128 mask from the address and convert to string
-        routerAddress = IPv6Interface(routerAddress).ip.__str__()
-        # Return the address
-        return routerAddress
+        # Generate the router address and convert to string
+        return _packed_address(self.__class__, router_index, host_index, self.lhost)
 
     def getHostAddress(self, router_index, host_index):
-        # Generate the host address
-        prefix = int(IPv6Interface(IPv6AccessNetAllocator.net).ip)
-        hostAddress = IPv6Network(prefix | router_index << 96 | 3 << 80 | host_index << 64 | 2)
-        # Remove /128 mask from the address and convert to string
-        hostAddress = IPv6Interface(hostAddress).ip.__str__()
-        # Return the address
-        return hostAddress
+        # Generate the host address and convert to string
+        return _packed_address(self.__class__, router_index, host_index, self.rhost)
 
 
-class IPv4AccessNetAllocator(object):
+class IPv4AccessNetAllocator(BitPackedIPv4Allocator):
 
     # fcff:xxxx:3::/48 customer facing subnets
 
@@ -355,39 +560,30 @@ class IPv4AccessNetAllocator(object):
     # fcff:xxxx:3:yy00::1/64 address of router xxxx
     # fcff:xxxx:3:yy00::2/64 address of host yy
 
+    __slots__ = ()
     bit = 16
     net = u"10.0.0.0/%s" % bit
     prefix = 30
+    _PREFIX_INT = _net_int(net, IPv4Interface)
+    _BASE_INT = _PREFIX_INT
+    _NET_MASK = _net_mask(prefix, 32)
+    lshift = 9
+    rshift = 2
 
     def getNet(self, router_index, host_index):
         # Generate the operator net
-        prefix = int(IPv4Interface(IPv4AccessNetAllocator.net).ip)
-        operatorNet = IPv4Network(prefix | router_index << 9 | host_index << 2)
-        # Append prefix to the net
-        operatorNet = operatorNet.supernet(new_prefix=IPv4AccessNetAllocator.prefix)
-        # Return the net
-        return operatorNet
+        return _packed_net(self.__class__, router_index, host_index)
 
     def getRouterAddress(self, router_index, host_index):
-        # Generate the router address
-        prefix = int(IPv4Interface(IPv4AccessNetAllocator.net).ip)
-        routerAddress = IPv4Network(prefix | router_index << 9 | host_index << 2 | 1)
-        # Remove /128 mask from the address and convert to string
-        routerAddress = IPv4Interface(routerAddress).ip.__str__()
-        # Return the address
-        return routerAddress
+        # Generate the router address and convert to string
+        return _packed_address(self.__class__, router_index, host_index, self.lhost)
 
     def getHostAddress(self, router_index, host_index):
-        # Generate the host address
-        prefix = int(IPv4Interface(IPv4AccessNetAllocator.net).ip)
-        hostAddress = IPv4Network(prefix | router_index << 9 | host_index << 2 | 2)
-        # Remove /128 mask from the address and convert to string
-        hostAddress = IPv4Interface(hostAddress).ip.__str__()
-        # Return the address
-        return hostAddress
+        # Generate the host address and convert to string
+        return _packed_address(self.__class__, router_index, host_index, self.rhost)
 
 
-class IPv6CustomerNetAllocator(object):
+class IPv6CustomerNetAllocator(BitPackedIPv6Allocator):
 
   # fd00::/8 customers’ networks
   # e.g. fd00:x:y::/48 is a network
@@ -395,41 +591,30 @@ class IPv6CustomerNetAllocator(object):
   # fd00:x:y::1 address of the PE router
   # fd00:x:y::2 address of the host
 
+    __slots__ = ()
     bit = 8
     net = u"fd00::/%s" % bit
     prefix = 48
+    _PREFIX_INT = _net_int(net)
+    _BASE_INT = _PREFIX_INT
+    _NET_MASK = _net_mask(prefix)
+    lshift = 96
+    rshift = 80
 
     def getNet(self, vpn_id, host_id):
         # Generate the customer net
-        prefix = int(IPv6Interface(IPv6CustomerNetAllocator.net).ip)
-        customerNet = IPv6Network(prefix | vpn_id << 96 | host_id << 80)
-        # Append prefix to the net
-        customerNet = customerNet.supernet(new_prefix=IPv6CustomerNetAllocator.prefix)
-        # Return the net
-        return customerNet
+        return _packed_net(self.__class__, vpn_id, host_id)
 
     def getRouterAddress(self, vpn_id, host_id):
-        # Generate the router address
-        prefix = int(IPv6Interface(IPv6CustomerNetAllocator.net).ip)
-        routerAddress = IPv6Network(prefix | vpn_id << 96 | host_id << 80 | 1)
-        # Remove /128 mask from the address and convert to string
-        routerAddress = IPv6Interface(routerAddress).ip.__str__()
-        #routerAddress = "%s/%s" % (routerAddress, IPv6CustomerNetAllocator.prefix)
-        # Return the address
-        return routerAddress
+        # Generate the router address and convert to string
+        return _packed_address(self.__class__, vpn_id, host_id, self.lhost)
 
     def getHostAddress(self, vpn_id, host_id):
-        # Generate the host address
-        prefix = int(IPv6Interface(IPv6CustomerNetAllocator.net).ip)
-        hostAddress = IPv6Network(prefix | vpn_id << 96 | host_id << 80 | 2)
-        # Remove /128 mask from the address and convert to string
-        hostAddress = IPv6Interface(hostAddress).ip.__str__()
-        #hostAddress = "%s/%s" % (hostAddress, IPv6CustomerNetAllocator.prefix)
-        # Return the address
-        return hostAddress
+        # Generate the host address and convert to string
+        return _packed_address(self.__class__, vpn_id, host_id, self.rhost)
 
 
-class IPv4CustomerNetAllocator(object):
+class IPv4CustomerNetAllocator(BitPackedIPv4Allocator):
 
     # 10.0.0.0/8 customers’ networks
     # e.g. 10.x.y.0/24 is a network
@@ -437,106 +622,103 @@ class IPv4CustomerNetAllocator(object):
     # 10.x.y.1 address of the PE router
     # 10.x.y.2 address of the host
 
+    __slots__ = ()
     bit = 8
     net = u"10.0.0.0/%s" % bit
     prefix = 30
+    _PREFIX_INT = _net_int(net, IPv4Interface)
+    _BASE_INT = _PREFIX_INT
+    _NET_MASK = _net_mask(prefix, 32)
+    lshift = 16
+    rshift = 8
 
     def getNet(self, vpn_id, host_id):
         # Generate the customer net
-        prefix = int(IPv4Interface(IPv4CustomerNetAllocator.net).ip)
-        customerNet = IPv4Network(prefix | vpn_id << 16 | host_id << 8)
-        # Append prefix to the net
-        customerNet = customerNet.supernet(new_prefix=IPv4CustomerNetAllocator.prefix)
-        # Return the net
-        return customerNet
+        return _packed_net(self.__class__, vpn_id, host_id)
 
     def getRouterAddress(self, vpn_id, host_id):
-        # Generate the router address
-        prefix = int(IPv4Interface(IPv4CustomerNetAllocator.net).ip)
-        routerAddress = IPv4Network(prefix | vpn_id << 16 | host_id << 8 | 1)
-        # Remove /128 mask from the address and convert to string
-        routerAddress = IPv4Interface(routerAddress).ip.__str__()
-        # Return the address
-        return routerAddress
+        # Generate the router address and convert to string
+        return _packed_address(self.__class__, vpn_id, host_id, self.lhost)
 
     def getHostAddress(self, vpn_id, host_id):
-        # Generate the host address
-        prefix = int(IPv4Interface(IPv4CustomerNetAllocator.net).ip)
-        hostAddress = IPv4Network(prefix | vpn_id << 16 | host_id << 8 | 2)
-        # Remove /128 mask from the address and convert to string
-        hostAddress = IPv4Interface(hostAddress).ip.__str__()
-        # Return the address
-        return hostAddress
+        # Generate the host address and convert to string
+        return _packed_address(self.__class__, vpn_id, host_id, self.rhost)
 
 
 # Allocates mgmt address
-class IPv6MgmtAllocator(object):
+class IPv6MgmtAllocator(BitPackedIPv6Allocator):
+
+    # The controller gets the ::2 address, the router the ::1 address
 
+    __slots__ = ()
     bit = 16
     net = u"2000::/%d" % bit
     prefix = 64
+    _PREFIX_INT = _net_int(net)
+    _BASE_INT = _PREFIX_INT
+    _NET_MASK = _net_mask(prefix)
+    lshift = 80
+    rshift = 64
+    lhost = 2
+    rhost = 1
 
     def getNet(self, controller_index, router_index):
-        # Generate the customer net
-        prefix = int(IPv6Interface(IPv6MgmtAllocator.net).ip)
-        customerNet = IPv6Network(prefix | controller_index << 80 | router_index << 64)
-        # Append prefix to the net
-        customerNet = customerNet.supernet(new_prefix=IPv6MgmtAllocator.prefix)
-        # Return the net
-        return customerNet
+        # Generate the mgmt net
+        return _packed_net(self.__class__, controller_index, router_index)
 
     def getControllerAddress(self, controller_index, router_index):
-        # Generate the host address
-        prefix = int(IPv6Interface(IPv6MgmtAllocator.net).ip)
-        hostAddress = IPv6Network(prefix | controller_index << 80 | router_index << 64 | 2)
-        # Remove /128 mask from the address and convert to string
-        hostAddress = IPv6Interface(hostAddress).ip.__str__()
-        # Return the address
-        return hostAddress
+        # Generate the controller address and convert to string
+        return _packed_address(self.__class__, controller_index, router_index, self.lhost)
 
     def getRouterAddress(self, controller_index, router_index):
-        # Generate the router address
-        prefix = int(IPv6Interface(IPv6MgmtAllocator.net).ip)
-        routerAddress = IPv6Network(prefix | controller_index << 80 | router_index << 64 | 1)
-        # Remove /128 mask from the address and convert to string
-        routerAddress = IPv6Interface(routerAddress).ip.__str__()
-        # Return the address
-        return routerAddress
+        # Generate the router address and convert to string
+        return _packed_address(self.__class__, controller_index, router_index, self.rhost)
 
 
 # Allocates mgmt address
-class IPv4MgmtAllocator(object):
+class IPv4MgmtAllocator(BitPackedIPv4Allocator):
 
+    __slots__ = ()
     bit = 12
     net = u"172.0.0.0/%d" % bit
     prefix = 30
+    _PREFIX_INT = _net_int(net, IPv4Interface)
+    _BASE_INT = _PREFIX_INT
+    _NET_MASK = _net_mask(prefix, 32)
+    lshift = 11
+    rshift = 2
 
     def getNet(self, controller_index, router_index):
-        # Generate the customer net
-        prefix = int(IPv4Interface(IPv4MgmtAllocator.net).ip)
-        customerNet = IPv4Network(prefix | controller_index << 11 | router_index << 2)
-        # Append prefix to the net
-        customerNet = customerNet.supernet(new_prefix=IPv4MgmtAllocator.prefix)
-        # Return the net
-        return customerNet
+        # Generate the mgmt net
+        return _packed_net(self.__class__, controller_index, router_index)
 
     def getControllerAddress(self, controller_index, router_index):
-        # Generate the host address
-        prefix = int(IPv4Interface(IPv4MgmtAllocator.net).ip)
-        hostAddress = IPv4Network(prefix | controller_index << 11 | router_index << 2 | 1)
-        # Remove /128 mask from the address and convert to string
-        hostAddress = IPv4Interface(hostAddress).ip.__str__()
-        # Return the address
-        return hostAddress
+        # Generate the controller address and convert to string
+        return _packed_address(self.__class__, controller_index, router_index, self.lhost)
 
     def getRouterAddress(self, controller_index, router_index):
-        # Generate the router address
-        prefix = int(IPv4Interface(IPv4MgmtAllocator.net).ip)
-        routerAddress = IPv4Network(prefix | controller_index << 11 | router_index << 2 | 2)
-        # Remove /128 mask from the address and convert to string
-        routerAddress = IPv4Interface(routerAddress).ip.__str__()
-        # Return the address
-        return routerAddress
+        # Generate the router address and convert to string
+        return _packed_address(self.__class__, controller_index, router_index, self.rhost)
+
+
+# Yield the properties of a batch of links: the index lookups and the
+# allocator methods are resolved once for the whole batch, so the loop
+# body only does the bit work of the allocators
+def _iterLinksProperties(links, node_to_index, getLinkTriple,
+                         prefix, verbose):
+  for link in links:
+    if verbose:
+      print("(%s,%s)" % (link[0], link[1]))
+
+    _lnode = node_to_index[link[0]]
+    _rnode = node_to_index[link[1]]
+
+    _net, iplhs, iprhs = getLinkTriple(_lnode, _rnode)
+
+    linkproperties = LinkProperties(iplhs, iprhs, _net, prefix)
+    if verbose:
+      print(linkproperties)
+    yield linkproperties
 
 
 # Generator of
@@ -545,154 +727,110 @@ class IPv6PropertiesGenerator(object):
   def __init__(self):
     self.verbose = False
     self.index = 0
-    self.loopbackAllocator = LoopbackAllocator()
-    self.routerIdAllocator = RouterIdAllocator()
     self.netAllocator = IPv6NetAllocator()
     self.customerFacingNetAllocator = IPv6CustomerFacingNetAllocator()
     self.accessNetAllocator = IPv6AccessNetAllocator()
-    self.routerNetAllocator = RouterNetAllocator()
     self.mgmtNetAllocator = IPv6MgmtAllocator()
     self.node_to_index = dict()
     self.allocated = 1
 
   # Generater for router properties
   def getRoutersProperties(self, nodes):
-    output = []
+    return list(self.iterRoutersProperties(nodes))
+
+  # Same as getRoutersProperties, but the properties are yielded one at a time:
+  # each node is registered when its properties are yielded, so the
+  # iterator has to be consumed before generating the links of the nodes
+  def iterRoutersProperties(self, nodes):
+    verbose = self.verbose
+    node_to_index = self.node_to_index
     for node in nodes:
-      if self.verbose == True:
+      if verbose:
         print(node)
       self.index += 1
-      loopback = self.loopbackAllocator.getLoopbackAddress(self.index)
-      routerid = self.routerIdAllocator.getRouterId(self.index)
-      routernet = self.routerNetAllocator.getRouterNet(self.index)
+      index = self.index
+      loopback, routerid, routernet = _router_triple(index)
       mgmtip = None
       #mgmtip = self.mgmtNetAllocator.getMgmtAddress(self.index)
-      routerproperties = RouterProperties(loopback, routerid, routernet, mgmtip, self.index)
-      self.node_to_index[node] = self.index
-      if self.verbose == True:
+      routerproperties = RouterProperties(loopback, routerid, routernet, mgmtip, index)
+      node_to_index[node] = index
+      if verbose:
         print(routerproperties)
-      output.append(routerproperties)
-    return output
+      yield routerproperties
 
   # Generater for router properties
   def getHostsProperties(self, nodes):
-    output = []
+    return list(self.iterHostsProperties(nodes))
+
+  # Same as getHostsProperties, but the properties are yielded one at a time:
+  # each node is registered when its properties are yielded, so the
+  # iterator has to be consumed before generating the links of the nodes
+  def iterHostsProperties(self, nodes):
+    verbose = self.verbose
+    node_to_index = self.node_to_index
     for node in nodes:
-      if self.verbose == True:
+      if verbose:
         print(node)
       self.index += 1
-      loopback = self.loopbackAllocator.getLoopbackAddress(self.index)
+      index = self.index
+      loopback = LoopbackAllocator.getLoopbackAddress(index)
       mgmtip = None
       #mgmtip = self.mgmtNetAllocator.getMgmtAddress(self.index)
-      hostproperties = HostProperties(loopback, mgmtip, self.index)
-      self.node_to_index[node] = self.index
-      if self.verbose == True:
+      hostproperties = HostProperties(loopback, mgmtip, index)
+      node_to_index[node] = index
+      if verbose:
         print(hostproperties)
-      output.append(hostproperties)
-    return output
+      yield hostproperties
 
   # Generator for link properties
   def getCoreLinksProperties(self, links):
-    output = []
+    return list(self.iterCoreLinksProperties(links))
 
-    if self.verbose == True:
+  # Same as getCoreLinksProperties, but the properties are yielded one at a time
+  def iterCoreLinksProperties(self, links):
+    if self.verbose:
       print(net)
 
-    for link in links:
-      if self.verbose == True:
-        print("(%s,%s)" % (link[0], link[1]))
-
-      _lrouter = self.node_to_index[link[0]]
-      _rrouter = self.node_to_index[link[1]]
-
-      _net = self.netAllocator.getNet(_lrouter, _rrouter)
-      l_router = self.netAllocator.getLRouterAddress(_lrouter, _rrouter)
-      r_router = self.netAllocator.getRRouterAddress(_lrouter, _rrouter)
-
-      iplhs = l_router.__str__()
-      iprhs = r_router.__str__()
-      ospf6net = _net.__str__()
-
-      linkproperties = LinkProperties(iplhs, iprhs, ospf6net, self.netAllocator.prefix)
-      if self.verbose == True:
-        print(linkproperties)
-      output.append(linkproperties)
-    return output
+    allocator = self.netAllocator
+    return _iterLinksProperties(links, self.node_to_index,
+                                allocator.getLinkTriple,
+                                allocator.prefix, self.verbose)
 
   # Generator for link properties
   def getEdgeLinksProperties(self, links):
-    output = []
+    return list(self.iterEdgeLinksProperties(links))
 
-    if self.verbose == True:
+  # Same as getEdgeLinksProperties, but the properties are yielded one at a time
+  def iterEdgeLinksProperties(self, links):
+    if self.verbose:
       print(net)
 
-    for link in links:
-      if self.verbose == True:
-        print("(%s,%s)" % (link[0], link[1]))
-
-      _lnode = self.node_to_index.get(link[0])
-      _rnode = self.node_to_index.get(link[1])
-      _net = self.customerFacingNetAllocator.getNet(_lnode, _rnode)
-      l_node = self.customerFacingNetAllocator.getRouterAddress(_lnode, _rnode)
-      r_node = self.customerFacingNetAllocator.getHostAddress(_lnode, _rnode)
-
-      iplhs = l_node.__str__()
-      iprhs = r_node.__str__()
-      ospf6net = _net.__str__()
-
-      linkproperties = LinkProperties(iplhs, iprhs, ospf6net, self.customerFacingNetAllocator.prefix)
-      if self.verbose == True:
-        print(linkproperties)
-      output.append(linkproperties)
-    return output
+    allocator = self.customerFacingNetAllocator
+    return _iterLinksProperties(links, self.node_to_index,
+                                allocator.getLinkTriple,
+                                allocator.prefix, self.verbose)
 
   # Generator for link properties
   def getAccessLinksProperties(self, links):
-    output = []
-
-    for link in links:
-      if self.verbose == True:
-        print("(%s,%s)" % (link[0], link[1]))
+    return list(self.iterAccessLinksProperties(links))
 
-      _lnode = self.node_to_index.get(link[0])
-      _rnode = self.node_to_index.get(link[1])
-      _net = self.accessNetAllocator.getNet(_lnode, _rnode)
-      l_node = self.accessNetAllocator.getRouterAddress(_lnode, _rnode)
-      r_node = self.accessNetAllocator.getHostAddress(_lnode, _rnode)
-
-      iplhs = l_node.__str__()
-      iprhs = r_node.__str__()
-      net = _net.__str__()
-
-      linkproperties = LinkProperties(iplhs, iprhs, net, self.accessNetAllocator.prefix)
-      if self.verbose == True:
-        print(linkproperties)
-      output.append(linkproperties)
-    return output
+  # Same as getAccessLinksProperties, but the properties are yielded one at a time
+  def iterAccessLinksProperties(self, links):
+    allocator = self.accessNetAllocator
+    return _iterLinksProperties(links, self.node_to_index,
+                                allocator.getLinkTriple,
+                                allocator.prefix, self.verbose)
 
   # Generator for link properties
   def getMgmtLinksProperties(self, links):
-    output = []
-
-    for link in links:
-      if self.verbose == True:
-        print("(%s,%s)" % (link[0], link[1]))
-
-      _lnode = self.node_to_index.get(link[0])
-      _rnode = self.node_to_index.get(link[1])
-      _net = self.mgmtNetAllocator.getNet(_lnode, _rnode)
-      l_node = self.mgmtNetAllocator.getControllerAddress(_lnode, _rnode)
-      r_node = self.mgmtNetAllocator.getRouterAddress(_lnode, _rnode)
+    return list(self.iterMgmtLinksProperties(links))
 
-      iplhs = l_node.__str__()
-      iprhs = r_node.__str__()
-      net = _net.__str__()
-
-      linkproperties = LinkProperties(iplhs, iprhs, net, self.mgmtNetAllocator.prefix)
-      if self.verbose == True:
-        print(linkproperties)
-      output.append(linkproperties)
-    return output
+  # Same as getMgmtLinksProperties, but the properties are yielded one at a time
+  def iterMgmtLinksProperties(self, links):
+    allocator = self.mgmtNetAllocator
+    return _iterLinksProperties(links, self.node_to_index,
+                                allocator.getLinkTriple,
+                                allocator.prefix, self.verbose)
 
   '''
   # Generator for mgmt station address
@@ -709,7 +847,6 @@ class IPv4PropertiesGenerator(object):
   def __init__(self):
     self.verbose = False
     self.index = 0
-    self.routerIdAllocator = RouterIdAllocator()
     self.netAllocator = IPv4NetAllocator()
     self.customerFacingNetAllocator = IPv4CustomerFacingNetAllocator()
     self.accessNetAllocator = IPv4AccessNetAllocator()
@@ -719,136 +856,97 @@ class IPv4PropertiesGenerator(object):
 
   # Generater for router properties
   def getRoutersProperties(self, nodes):
-    output = []
+    return list(self.iterRoutersProperties(nodes))
+
+  # Same as getRoutersProperties, but the properties are yielded one at a time:
+  # each node is registered when its properties are yielded, so the
+  # iterator has to be consumed before generating the links of the nodes
+  def iterRoutersProperties(self, nodes):
+    verbose = self.verbose
+    node_to_index = self.node_to_index
     for node in nodes:
-      if self.verbose == True:
+      if verbose:
         print(node)
       self.index += 1
+      index = self.index
       loopback = None
-      routerid = self.routerIdAllocator.getRouterId(self.index)
+      routerid = RouterIdAllocator.getRouterId(index)
       routernet = None
       mgmtip = None
       #mgmtip = self.mgmtAllocator.getMgmtAddress(self.index)
-      routerproperties = RouterProperties(loopback, routerid, routernet, mgmtip, self.index)
-      self.node_to_index[node] = self.index
-      if self.verbose == True:
+      routerproperties = RouterProperties(loopback, routerid, routernet, mgmtip, index)
+      node_to_index[node] = index
+      if verbose:
         print(routerproperties)
-      output.append(routerproperties)
-    return output
+      yield routerproperties
 
   # Generater for router properties
   def getHostsProperties(self, nodes):
-    output = []
+    return list(self.iterHostsProperties(nodes))
+
+  # Same as getHostsProperties, but the properties are yielded one at a time:
+  # each node is registered when its properties are yielded, so the
+  # iterator has to be consumed before generating the links of the nodes
+  def iterHostsProperties(self, nodes):
+    verbose = self.verbose
+    node_to_index = self.node_to_index
     for node in nodes:
-      if self.verbose == True:
+      if verbose:
         print(node)
       self.index += 1
+      index = self.index
       loopback = None
       mgmtip = None
       #mgmtip = self.mgmtAllocator.getMgmtAddress(self.index)
-      hostproperties = HostProperties(loopback, mgmtip, self.index)
-      self.node_to_index[node] = self.index
-      if self.verbose == True:
+      hostproperties = HostProperties(loopback, mgmtip, index)
+      node_to_index[node] = index
+      if verbose:
         print(hostproperties)
-      output.append(hostproperties)
-    return output
+      yield hostproperties
 
   # Generator for link properties
   def getCoreLinksProperties(self, links):
-    output = []
-
-    for link in links:
-      if self.verbose == True:
-        print("(%s,%s)" % (link[0], link[1]))
-
-      _lrouter = self.node_to_index[link[0]]
-      _rrouter = self.node_to_index[link[1]]
-
-      _net = self.netAllocator.getNet(_lrouter, _rrouter)
-      l_router = self.netAllocator.getLRouterAddress(_lrouter, _rrouter)
-      r_router = self.netAllocator.getRRouterAddress(_lrouter, _rrouter)
+    return list(self.iterCoreLinksProperties(links))
 
-      iplhs = l_router.__str__()
-      iprhs = r_router.__str__()
-      net = _net.__str__()
-
-      linkproperties = LinkProperties(iplhs, iprhs, net, self.netAllocator.prefix)
-      if self.verbose == True:
-        print(linkproperties)
-      output.append(linkproperties)
-    return output
+  # Same as getCoreLinksProperties, but the properties are yielded one at a time
+  def iterCoreLinksProperties(self, links):
+    allocator = self.netAllocator
+    return _iterLinksProperties(links, self.node_to_index,
+                                allocator.getLinkTriple,
+                                allocator.prefix, self.verbose)
 
   # Generator for link properties
   def getEdgeLinksProperties(self, links):
-    output = []
-
-    for link in links:
-      if self.verbose == True:
-        print("(%s,%s)" % (link[0], link[1]))
-
-      _lnode = self.node_to_index.get(link[0])
-      _rnode = self.node_to_index.get(link[1])
-      _net = self.customerFacingNetAllocator.getNet(_lnode, _rnode)
-      l_node = self.customerFacingNetAllocator.getRouterAddress(_lnode, _rnode)
-      r_node = self.customerFacingNetAllocator.getHostAddress(_lnode, _rnode)
-
-      iplhs = l_node.__str__()
-      iprhs = r_node.__str__()
-      net = _net.__str__()
+    return list(self.iterEdgeLinksProperties(links))
 
-      linkproperties = LinkProperties(iplhs, iprhs, net, self.customerFacingNetAllocator.prefix)
-      if self.verbose == True:
-        print(linkproperties)
-      output.append(linkproperties)
-    return output
+  # Same as getEdgeLinksProperties, but the properties are yielded one at a time
+  def iterEdgeLinksProperties(self, links):
+    allocator = self.customerFacingNetAllocator
+    return _iterLinksProperties(links, self.node_to_index,
+                                allocator.getLinkTriple,
+                                allocator.prefix, self.verbose)
 
   # Generator for link properties
   def getAccessLinksProperties(self, links):
-    output = []
-
-    for link in links:
-      if self.verbose == True:
-        print("(%s,%s)" % (link[0], link[1]))
-
-      _lnode = self.node_to_index.get(link[0])
-      _rnode = self.node_to_index.get(link[1])
-      _net = self.accessNetAllocator.getNet(_lnode, _rnode)
-      l_node = self.accessNetAllocator.getRouterAddress(_lnode, _rnode)
-      r_node = self.accessNetAllocator.getHostAddress(_lnode, _rnode)
-
-      iplhs = l_node.__str__()
-      iprhs = r_node.__str__()
-      net = _net.__str__()
+    return list(self.iterAccessLinksProperties(links))
 
-      linkproperties = LinkProperties(iplhs, iprhs, net, self.accessNetAllocator.prefix)
-      if self.verbose == True:
-        print(linkproperties)
-      output.append(linkproperties)
-    return output
+  # Same as getAccessLinksProperties, but the properties are yielded one at a time
+  def iterAccessLinksProperties(self, links):
+    allocator = self.accessNetAllocator
+    return _iterLinksProperties(links, self.node_to_index,
+                                allocator.getLinkTriple,
+                                allocator.prefix, self.verbose)
 
   # Generator for link properties
   def getMgmtLinksProperties(self, links):
-    output = []
-
-    for link in links:
-      if self.verbose == True:
-        print("(%s,%s)" % (link[0], link[1]))
-
-      _lnode = self.node_to_index.get(link[0])
-      _rnode = self.node_to_index.get(link[1])
-      _net = self.mgmtNetAllocator.getNet(_lnode, _rnode)
-      l_node = self.mgmtNetAllocator.getControllerAddress(_lnode, _rnode)
-      r_node = self.mgmtNetAllocator.getRouterAddress(_lnode, _rnode)
-
-      iplhs = l_node.__str__()
-      iprhs = r_node.__str__()
-      net = _net.__str__()
-
-      linkproperties = LinkProperties(iplhs, iprhs, net, self.mgmtNetAllocator.prefix)
-      if self.verbose == True:
-        print(linkproperties)
-      output.append(linkproperties)
-    return output
+    return list(self.iterMgmtLinksProperties(links))
+
+  # Same as getMgmtLinksProperties, but the properties are yielded one at a time
+  def iterMgmtLinksProperties(self, links):
+    allocator = self.mgmtNetAllocator
+    return _iterLinksProperties(links, self.node_to_index,
+                                allocator.getLinkTriple,
+                                allocator.prefix, self.verbose)
   
   '''
   # Generator for mgmt station address
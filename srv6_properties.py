@@ -27,6 +27,8 @@ from __future__ import print_function
 
 # Store an OSPF network
 class OSPFNetwork(object):
+
+  __slots__ = ('net', 'netbitOSPF', 'subnet', 'cost', 'hello_int', 'area', 'name')
  
   def __init__(self, name, net, cost=1, hello_int=5, area="0.0.0.0"):
 
@@ -61,6 +63,8 @@ class ControllerProperties(object):
 
  # Encapsulate router properties
 class RouterProperties(object):
+
+  __slots__ = ('loopback', 'routerid', 'routernet', 'mgmtip', 'index')
   
   def __init__(self, loopback, routerid, routernet, mgmtip, index):
     self.loopback = loopback
@@ -75,6 +79,8 @@ class RouterProperties(object):
  # Encapsulate router properties
 class HostProperties(object):
 
+  __slots__ = ('loopback', 'mgmtip', 'index')
+
   def __init__(self, loopback, mgmtip, index):
     self.loopback = loopback
     self.mgmtip = mgmtip
@@ -99,6 +105,8 @@ class ControllerProperties(object):
 # Encapsulate link properties used to build the testbed object in softfire-tiesr-deployer
 class LinkProperties(object):
 
+  __slots__ = ('iplhs', 'iprhs', 'net', 'prefix')
+
   def __init__(self, iplhs, iprhs, net, prefix):
     self.iplhs = iplhs
     self.iprhs = iprhs
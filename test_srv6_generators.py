@@ -0,0 +1,239 @@
+#!/usr/bin/python
+
+##############################################################################################
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Tests for the generators for Segment Routing IPv6:
+# the hand-written formatters are checked against ipaddress
+
+import random
+import unittest
+
+from ipaddress import IPv6Address
+from ipaddress import IPv6Network
+from ipaddress import IPv4Address
+from ipaddress import AddressValueError
+
+import srv6_generators
+from srv6_generators import SIDAllocator
+from srv6_generators import LoopbackAllocator
+from srv6_generators import RouterNetAllocator
+from srv6_generators import RouterIdAllocator
+from srv6_generators import IPv6NetAllocator
+from srv6_generators import IPv4NetAllocator
+from srv6_generators import IPv6CustomerFacingNetAllocator
+from srv6_generators import IPv4CustomerFacingNetAllocator
+from srv6_generators import IPv6AccessNetAllocator
+from srv6_generators import IPv4AccessNetAllocator
+from srv6_generators import IPv6CustomerNetAllocator
+from srv6_generators import IPv4CustomerNetAllocator
+from srv6_generators import IPv6MgmtAllocator
+from srv6_generators import IPv4MgmtAllocator
+
+# Indexes around the limits of the fixed-shape formats
+BOUNDARIES = [0, 1, 2, 0xfffe, 0xffff, 0x10000, 0x10001, 0xfffff, 0xffffffff]
+
+
+# Addresses with every combination of zero and non-zero groups,
+# so that every zero run is compressed at least once
+def _zero_run_addresses():
+    for mask in range(256):
+        for value in (1, 0xffff):
+            ip_int = 0
+            for i in range(8):
+                if not mask >> i & 1:
+                    ip_int |= value << (16 * (7 - i))
+            yield ip_int
+
+
+class IPv6FormatterTest(unittest.TestCase):
+
+    def _addresses(self):
+        rnd = random.Random(0)
+        addresses = list(_zero_run_addresses())
+        addresses += [0, 1, 2 ** 128 - 1, 2 ** 112, 2 ** 112 - 1]
+        addresses += [rnd.getrandbits(128) for _ in range(2000)]
+        addresses += [rnd.getrandbits(128) & rnd.getrandbits(128) & rnd.getrandbits(128)
+                      for _ in range(2000)]
+        return addresses
+
+    def test_py_formatter(self):
+        for ip_int in self._addresses():
+            self.assertEqual(srv6_generators._ipv6_int_to_str_py(ip_int),
+                             str(IPv6Address(ip_int)))
+
+    def test_formatter(self):
+        for ip_int in self._addresses():
+            self.assertEqual(srv6_generators._ipv6_int_to_str(ip_int),
+                             str(IPv6Address(ip_int)))
+
+    def test_out_of_range(self):
+        for ip_int in (-1, 2 ** 128, -2 ** 130, 2 ** 200):
+            self.assertRaises(AddressValueError,
+                              srv6_generators._ipv6_int_to_str, ip_int)
+            self.assertRaises(AddressValueError,
+                              srv6_generators._ipv6_int_to_str_py, ip_int)
+        for router_index in (-1, 2 ** 32):
+            self.assertRaises(AddressValueError,
+                              RouterIdAllocator.getRouterId, router_index)
+        self.assertRaises(AddressValueError,
+                          IPv6NetAllocator().getLRouterAddress, 0, -1)
+        self.assertRaises(AddressValueError,
+                          IPv6NetAllocator().getLinkTriple, 2 ** 48, 0)
+
+
+class FixedShapeTest(unittest.TestCase):
+
+    def test_sid(self):
+        allocator = SIDAllocator()
+        for router_index in BOUNDARIES:
+            router_id = RouterIdAllocator.getRouterId(router_index)
+            for vpn_id in BOUNDARIES:
+                expected = str(IPv6Address(SIDAllocator._BASE_INT |
+                                           router_index << 96 | vpn_id))
+                self.assertEqual(allocator.getSID(router_id, vpn_id), expected)
+                self.assertEqual(SIDAllocator.getSIDByIndex(router_index, vpn_id),
+                                 expected)
+
+    def test_sid_keywords(self):
+        allocator = SIDAllocator()
+        self.assertEqual(allocator.getSID(router_id="0.0.0.5", vpn_id=3),
+                         allocator.getSID("0.0.0.5", 3))
+        self.assertEqual(allocator.getSIDFamily(router_id="0.0.0.5"),
+                         allocator.getSIDFamily("0.0.0.5"))
+
+    def test_sid_static(self):
+        self.assertEqual(SIDAllocator.getSID("0.0.0.5", 3),
+                         SIDAllocator().getSID("0.0.0.5", 3))
+        self.assertEqual(SIDAllocator.getSIDFamily("0.0.0.5"),
+                         SIDAllocator().getSIDFamily("0.0.0.5"))
+
+    def test_sid_family(self):
+        allocator = SIDAllocator()
+        for router_index in BOUNDARIES:
+            router_id = RouterIdAllocator.getRouterId(router_index)
+            expected = str(IPv6Network((SIDAllocator._BASE_INT | router_index << 96,
+                                        SIDAllocator.prefix)))
+            self.assertEqual(allocator.getSIDFamily(router_id), expected)
+
+    def test_sid_templates(self):
+        for router_index in (0, 1, 0xffff):
+            family = str(IPv6Network((SIDAllocator._BASE_INT | router_index << 96,
+                                      SIDAllocator.prefix)))
+            self.assertEqual(SIDAllocator._SID_FAMILY_FMT % router_index, family)
+            for vpn_id in (1, 0xffff):
+                sid = str(IPv6Address(SIDAllocator._BASE_INT |
+                                      router_index << 96 | vpn_id))
+                self.assertEqual(SIDAllocator._SID_FMT % (router_index, vpn_id), sid)
+
+    def test_router_base(self):
+        for router_index in BOUNDARIES:
+            base = LoopbackAllocator._PREFIX_INT | router_index << 96
+            loopback = str(IPv6Address(base | 1))
+            routernet = str(IPv6Network((base, RouterNetAllocator.prefix)))
+            self.assertEqual(LoopbackAllocator.getLoopbackAddress(router_index),
+                             loopback)
+            self.assertEqual(RouterNetAllocator.getRouterNet(router_index),
+                             routernet)
+            self.assertEqual(srv6_generators._router_triple(router_index),
+                             (loopback, str(IPv4Address(router_index)), routernet))
+
+    def test_base_template(self):
+        for router_index in (1, 0xffff):
+            base = LoopbackAllocator._PREFIX_INT | router_index << 96
+            self.assertEqual(LoopbackAllocator._BASE_FMT % router_index,
+                             str(IPv6Address(base)))
+            base = RouterNetAllocator._PREFIX_INT | router_index << 96
+            self.assertEqual(RouterNetAllocator._BASE_FMT % router_index,
+                             str(IPv6Address(base)))
+
+
+# Allocators with the names of their indexes and of their methods
+ALLOCATORS = [
+    (IPv6NetAllocator, ('l_router_index', 'r_router_index'),
+     ('getNet', 'getLRouterAddress', 'getRRouterAddress')),
+    (IPv4NetAllocator, ('l_router_index', 'r_router_index'),
+     ('getNet', 'getLRouterAddress', 'getRRouterAddress')),
+    (IPv6CustomerFacingNetAllocator, ('router_index', 'host_index'),
+     ('getNet', 'getRouterAddress', 'getHostAddress')),
+    (IPv4CustomerFacingNetAllocator, ('router_index', 'host_index'),
+     ('getNet', 'getRouterAddress', 'getHostAddress')),
+    (IPv6AccessNetAllocator, ('router_index', 'host_index'),
+     ('getNet', 'getRouterAddress', 'getHostAddress')),
+    (IPv4AccessNetAllocator, ('router_index', 'host_index'),
+     ('getNet', 'getRouterAddress', 'getHostAddress')),
+    (IPv6CustomerNetAllocator, ('vpn_id', 'host_id'),
+     ('getNet', 'getRouterAddress', 'getHostAddress')),
+    (IPv4CustomerNetAllocator, ('vpn_id', 'host_id'),
+     ('getNet', 'getRouterAddress', 'getHostAddress')),
+    (IPv6MgmtAllocator, ('controller_index', 'router_index'),
+     ('getNet', 'getControllerAddress', 'getRouterAddress')),
+    (IPv4MgmtAllocator, ('controller_index', 'router_index'),
+     ('getNet', 'getControllerAddress', 'getRouterAddress')),
+]
+
+
+# Net and addresses of the two sides for the indexes (1, 2),
+# following the address layout of each allocator
+LAYOUTS = [
+    (IPv6NetAllocator, ('fcf0:0:1:2::/64', 'fcf0:0:1:2::1', 'fcf0:0:1:2::2')),
+    (IPv4NetAllocator, ('11.0.32.8/30', '11.0.32.9', '11.0.32.10')),
+    (IPv6CustomerFacingNetAllocator, ('fcff:1:3:2::/64', 'fcff:1:3:2::1', 'fcff:1:3:2::2')),
+    (IPv4CustomerFacingNetAllocator, ('192.168.2.0/24', '192.168.2.9', '192.168.2.10')),
+    (IPv6AccessNetAllocator, ('fcfb:1:3:2::/64', 'fcfb:1:3:2::1', 'fcfb:1:3:2::2')),
+    (IPv4AccessNetAllocator, ('10.0.2.8/30', '10.0.2.9', '10.0.2.10')),
+    (IPv6CustomerNetAllocator, ('fd00:1:2::/48', 'fd00:1:2::1', 'fd00:1:2::2')),
+    (IPv4CustomerNetAllocator, ('10.1.2.0/30', '10.1.2.1', '10.1.2.2')),
+    # The controller gets ::2 and the router ::1
+    (IPv6MgmtAllocator, ('2000:0:1:2::/64', '2000:0:1:2::2', '2000:0:1:2::1')),
+    # The controller gets .1 and the router .2
+    (IPv4MgmtAllocator, ('172.0.8.8/30', '172.0.8.9', '172.0.8.10')),
+]
+
+
+class BitPackedAllocatorTest(unittest.TestCase):
+
+    def test_layout(self):
+        layouts = dict(LAYOUTS)
+        for cls, _, methods in ALLOCATORS:
+            allocator = cls()
+            self.assertEqual(tuple(str(getattr(allocator, method)(1, 2))
+                                   for method in methods), layouts[cls])
+            net, lhs, rhs = layouts[cls]
+            self.assertEqual(allocator.getLinkTriple(1, 2), (net, lhs, rhs))
+
+    def test_keywords(self):
+        for cls, (lname, rname), methods in ALLOCATORS:
+            allocator = cls()
+            for method in methods:
+                method = getattr(allocator, method)
+                self.assertEqual(method(**{lname: 1, rname: 2}), method(1, 2))
+
+    def test_out_of_range(self):
+        self.assertRaises(AddressValueError,
+                          IPv6CustomerFacingNetAllocator().getNet, 2 ** 32, 0)
+        self.assertRaises(AddressValueError, IPv6NetAllocator().getNet, 0, -1)
+        self.assertRaises(AddressValueError, IPv4NetAllocator().getNet, 2 ** 19, 0)
+
+    def test_link_triple(self):
+        for cls, _, (getNet, getLAddress, getRAddress) in ALLOCATORS:
+            allocator = cls()
+            for l, r in ((0, 0), (1, 2), (3, 1), (5, 7)):
+                self.assertEqual(allocator.getLinkTriple(l, r),
+                                 (str(getattr(allocator, getNet)(l, r)),
+                                  getattr(allocator, getLAddress)(l, r),
+                                  getattr(allocator, getRAddress)(l, r)))
+
+
+if __name__ == '__main__':
+    unittest.main()